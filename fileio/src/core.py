@@ -1,5 +1,7 @@
 
 import os
+import asyncio
+import atexit
 import pickle
 import csv
 import yaml
@@ -11,28 +13,34 @@ import types
 import math
 import hashlib
 import random
-import gdown as gdownload
 import simdjson as json
-import gc
+import functools
+import shutil
+import subprocess
+import threading
+from concurrent import futures
 from typing import List, Union
 from tqdm.auto import tqdm
 from pprint import pprint
-from datetime import datetime, timedelta, timezone
-from itertools import islice, accumulate
-import multiprocessing as mp
+from datetime import datetime, timezone
+from itertools import accumulate
 import platform
 
 _gsutil = None
+_gcloud_storage = None
 _tmpdirs = []
+_session = None
+_session_lock = threading.Lock()
 
 from .gpath import PathIOLike
 from .generic_path import as_path
-from ..utils import logger
-from ..utils import lazy_import, lazy_install, lazy_check, Auth, exec_command, _enable_pbar, gsutil_exec
+from ..utils import logger, settings
+from ..utils import lazy_import, lazy_install, module_avail, exec_command, _enable_pbar, gsutil_exec, to_thread, reset_pool, get_executor, bounded_map
 
-_tf_avail = lazy_check('tensorflow')
-_torch_avail = lazy_check('torch')
-_dill_avail = lazy_check('dill')
+_tf_avail = module_avail('tensorflow')
+_torch_avail = module_avail('torch')
+_dill_avail = module_avail('dill')
+_aiohttp_avail = module_avail('aiohttp')
 
 if _dill_avail:
     import dill
@@ -74,12 +82,16 @@ disable_v2_behavior = tf.compat.v1.disable_v2_behavior
 timestamp = lambda: datetime.now(timezone.utc).isoformat('T')
 ftimestamp = lambda: datetime.now(timezone.utc).strftime("%b%d%Y_TM_%H%M%S")
 
-CPU_CORES = mp.cpu_count()
+CPU_CORES = os.cpu_count() or 1
 CURR_SYS = platform.system()
 
 _printer = pprint
 _pickler = pickle
-_picklers = ['dill', 'pickle', 'pkl']
+_picklers = frozenset(('dill', 'pickle', 'pkl'))
+_req_methods = frozenset(('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD'))
+_jsonl_formats = frozenset(('jsonl', 'jsonlines', 'jl', 'jlines'))
+_mkdir_flags = ('mkdir', 'mkdirs', 'makedir', 'makedirs')
+_wildcard_chars = frozenset('*?[')
 if _dill_avail:
     _pickler = dill
 
@@ -98,7 +110,7 @@ def _set_pickler(function=None, name='dill'):
             return
         except ImportError:
             logger.error(f'Unable to import {name}')
-        raise ValueError(f'{name} not a valid option: {_picklers}')
+        raise ValueError(f'{name} not a valid option: {sorted(_picklers)}')
     if name == 'dill':
         assert _dill_avail, 'Dill is not currently installed to be used'
         _pickler = dill
@@ -138,21 +150,86 @@ def check_gsutil():
     if not _gsutil:
         install_gsutil()
 
+def gcloud_storage_avail():
+    # `gcloud storage` runs its transfers in parallel natively and is much faster than gsutil
+    global _gcloud_storage
+    if _gcloud_storage is None:
+        _gcloud_storage = bool(shutil.which('gcloud')) and subprocess.call(['gcloud', 'storage', '--help'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0
+    return _gcloud_storage
+
+
+def get_session():
+    # A single Session is shared by all downloads so repeated/batch transfers
+    # reuse the same pooled connections instead of opening new ones per call.
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=settings.pool_size,
+                    pool_maxsize=settings.pool_size,
+                    max_retries=settings.max_retries
+                )
+                _session.mount('http://', adapter)
+                _session.mount('https://', adapter)
+    return _session
+
+def _reset_session():
+    # The old session is not closed, downloads still using it finish and it is then garbage collected
+    global _session
+    with _session_lock:
+        _session = None
+
+def _close_session():
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+
+atexit.register(_close_session)
+
 
 def get_pathlike(filepath: Union[str, PathIOLike]):
     if isinstance(filepath, str): filepath = as_path(filepath)
     return filepath
 
 def filter_files(files: List[Union[str, PathIOLike]], include=[], exclude=['.git']):
+    # Membership sets are built once; isdisjoint avoids a new set per file
+    include, exclude = frozenset(include), frozenset(exclude)
     files = [get_pathlike(f) for f in files]
-    if include: files = [f for f in files if bool(set(f.parts).intersection(include))]
-    if exclude: files = [f for f in files if not bool(set(f.parts).intersection(exclude))]
-    return files
+    return [f for f in files if (not include or not include.isdisjoint(f.parts)) and exclude.isdisjoint(f.parts)]
 
 
-def gsutil_sync(src_bucket: Union[str, PathIOLike], dest: Union[str, PathIOLike], dryrun: bool = True, max_procs=False, verbose=True, pbar=None, skip_check=False, fix_bucketnames=False, absolute=False):
+@functools.lru_cache(maxsize=None)
+def _sync_base_cmd(use_gcloud, dryrun, num_procs, num_threads):
+    if use_gcloud:
+        cmd_parts = ['gcloud storage rsync --recursive --no-clobber']
+        if dryrun: cmd_parts.append('--dry-run')
+        return ' '.join(cmd_parts)
+    options = [
+        "GSUtil:gzip_compression_level=9",
+        "GSUtil:sliced_object_download_threshold=50M",
+        "GSUtil:sliced_object_download_max_components=10",
+        f"GSUtil:parallel_process_count={num_procs}",
+        f"GSUtil:parallel_thread_count={num_threads}"
+    ]
+    cmd_parts = ['gsutil']
+    for opt in options:
+        cmd_parts.extend(('-o', opt))
+    cmd_parts.append('-m rsync -r -i')
+    if dryrun: cmd_parts.append('-n')
+    return ' '.join(cmd_parts)
+
+
+def gsutil_sync(src_bucket: Union[str, PathIOLike], dest: Union[str, PathIOLike], dryrun: bool = True, max_procs=False, verbose=True, pbar=None, skip_check=False, fix_bucketnames=False, absolute=False, use_gcloud=False):
+    # gcloud storage authenticates with gcloud credentials rather than the boto config gsutil uses, so it is opt-in.
+    # use_gcloud=None picks it whenever the gcloud CLI is available.
+    if use_gcloud is None:
+        use_gcloud = gcloud_storage_avail()
     if not skip_check:
-        check_gsutil()
+        if not use_gcloud:
+            check_gsutil()
         src_bucket, dest = get_pathlike(src_bucket), get_pathlike(dest)
         if not dryrun:
             dest.ensure_dir()
@@ -162,24 +239,14 @@ def gsutil_sync(src_bucket: Union[str, PathIOLike], dest: Union[str, PathIOLike]
         num_procs, num_threads = max(num_procs, (CPU_CORES * 2)), max(num_threads, (CPU_CORES * 2))
     if 'Darwin' in CURR_SYS or 'Windows' in CURR_SYS: num_procs = 1
     
-    options = [
-        "GSUtil:gzip_compression_level=9",
-        "GSUtil:sliced_object_download_threshold=50M",
-        "GSUtil:sliced_object_download_max_components=10",
-        f"GSUtil:parallel_process_count={num_procs}",
-        f"GSUtil:parallel_thread_count={num_threads}"
-    ]
-    base_cmd = 'gsutil'
-    for opt in options:
-        base_cmd += ' -o ' + opt
-    base_cmd += ' -m rsync -r -i'
-    if dryrun: base_cmd += ' -n'
+    base_cmd = _sync_base_cmd(bool(use_gcloud), dryrun, num_procs, num_threads)
 
     if verbose:
         logger.info('--------' * 4)
         logger.info(f'Dryrun: {dryrun}')
-        logger.info(f'Performance Mode Enabled: {max_procs}')
-        logger.info(f'Max Threads: {num_threads} | Max Processes: {num_procs}')
+        if not use_gcloud:
+            logger.info(f'Performance Mode Enabled: {max_procs}')
+            logger.info(f'Max Threads: {num_threads} | Max Processes: {num_procs}')
         logger.info(base_cmd)
         logger.info('--------' * 4)
 
@@ -199,13 +266,13 @@ def gsutil_sync(src_bucket: Union[str, PathIOLike], dest: Union[str, PathIOLike]
         yield {bucket_path: f'{ck:.2f} mins'}
 
 
-def gsutil_rsync(src_buckets: List[Union[str, PathIOLike]], dest: Union[str, PathIOLike], dryrun: bool = True, max_procs=False, verbose=True, fix_bucketnames=None, absolute=None):
+def gsutil_rsync(src_buckets: List[Union[str, PathIOLike]], dest: Union[str, PathIOLike], dryrun: bool = True, max_procs=False, verbose=True, fix_bucketnames=None, absolute=None, use_gcloud=False):
     src_buckets = [get_pathlike(b) for b in src_buckets]
     dest = get_pathlike(dest)
     pbar = tqdm(src_buckets, desc='Copying GCS', unit='buckets', dynamic_ncols=True)
     fix_bucketnames = fix_bucketnames if fix_bucketnames is not None else bool(not dest.is_gcs)
     absolute = absolute if absolute is not None else bool(dest.is_gcs)
-    yield from gsutil_sync(src_bucket=None, dest=dest, dryrun=dryrun, max_procs=max_procs, verbose=verbose, skip_check=True, pbar=pbar, fix_bucketnames=fix_bucketnames, absolute=absolute)
+    yield from gsutil_sync(src_bucket=None, dest=dest, dryrun=dryrun, max_procs=max_procs, verbose=verbose, skip_check=True, pbar=pbar, fix_bucketnames=fix_bucketnames, absolute=absolute, use_gcloud=use_gcloud)
     
 
 
@@ -249,9 +316,8 @@ class File(object):
         if not path:
             return usrdir
         _dir = os.path.join(usrdir, path, *paths)
-        for k in ['mkdir', 'mkdirs', 'makedir', 'makedirs']:
-            if kwargs.get(k):
-                mkdirs(_dir)
+        if any(kwargs.get(k) for k in _mkdir_flags):
+            mkdirs(_dir)
         return _dir
     
     @classmethod
@@ -307,6 +373,53 @@ class File(object):
     def rmdir(cls, filepath):
         return rmdir(filepath)
 
+    @classmethod
+    def batch_rm(cls, filenames, batch_size=1000):
+        if isinstance(filenames, str) or not isinstance(filenames, list):
+            filenames = [filenames]
+        # Wildcards are expanded by glob, which only returns objects that exist. Explicit names are
+        # checked on the pool, so every name handed to gsutil below is known to exist beforehand.
+        found, named = [], []
+        for fn in map(str, filenames):
+            if _wildcard_chars.isdisjoint(fn):
+                named.append(fn)
+            else:
+                found.extend(glob(fn))
+        executor = get_executor('transfer', settings.max_concurrency)
+        named_exists = bounded_map(executor, exists, named, limit=settings.max_concurrency)
+        missing = [{'filename': fn, 'error': 'Not Found'} for fn, ok in zip(named, named_exists) if not ok]
+        found.extend(fn for fn, ok in zip(named, named_exists) if ok)
+        gcs_files = [f for f in found if f.startswith('gs://')]
+        local_files = [f for f in found if not f.startswith('gs://') and isfile(f)]
+        failed = missing + File._rm_each(local_files)
+        if gcs_files:
+            check_gsutil()
+        # One gsutil call deletes a whole batch over shared connections instead of one request per object.
+        # Names are passed as argv, never through a shell.
+        for i in range(0, len(gcs_files), batch_size):
+            batch = gcs_files[i:i + batch_size]
+            proc = subprocess.run(['gsutil', '-m', '-q', 'rm', *batch], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if proc.returncode != 0:
+                # gsutil has usually removed the rest of the batch already, and every name here existed
+                # before the batch ran, so only objects that are still there count as failed
+                failed.extend(File._rm_each(batch, missing_ok=True))
+        total = len(missing) + len(local_files) + len(gcs_files)
+        logger.info(f'Removed {total - len(failed)}/{total} Files - Failed: {len(failed)}')
+        return failed
+
+    @classmethod
+    def _rm_each(cls, filenames, missing_ok=False):
+        def _rm(filename):
+            try:
+                rm(filename)
+            except tf.errors.NotFoundError as e:
+                if not missing_ok:
+                    return {'filename': filename, 'error': str(e)}
+            except Exception as e:
+                return {'filename': filename, 'error': str(e)}
+        executor = get_executor('transfer', settings.max_concurrency)
+        return [res for res in bounded_map(executor, _rm, filenames, limit=settings.max_concurrency) if res]
+
     @classmethod
     def copy(cls, src, dest, overwrite=True):
         try:
@@ -320,13 +433,19 @@ class File(object):
         if not exists(directory):
             mkdirs(directory)
         dest = os.path.join(directory, os.path.basename(src))
-        if not exists(dest) or overwrite:
-            if verbose:
-                logger(f'Copying {src} -> {dest}')
-            gcopy(src, dest, overwrite)
-        elif verbose:
-            logger(f'Skipping {src} -> {dest} Exists')
+        copied = File._gcopy(src, dest, overwrite)
+        if verbose:
+            logger.info(f'Copying {src} -> {dest}' if copied else f'Skipping {src} -> {dest} Exists')
         return dest
+
+    @classmethod
+    def _gcopy(cls, src, dest, overwrite=False):
+        # Let the copy reject an existing dest rather than paying for a separate exists() round trip
+        try:
+            gcopy(src, dest, overwrite)
+            return True
+        except tf.errors.AlreadyExistsError:
+            return False
     
     # Does not handle recursive
     @classmethod
@@ -336,7 +455,20 @@ class File(object):
             return File.gsutil(cmd)
         File.mkdirs(dest_dir)
         filenames = File.glob(File.dirglob(src_dir))
-        return [File.bcopy(fname, dest_dir, overwrite, verbose=True) for fname in filenames]
+        dests = File.get_dest_paths(filenames, dest_dir)
+        def _copy(src, dest):
+            copied = File._gcopy(src, dest, overwrite)
+            logger.info(f'Copying {src} -> {dest}' if copied else f'Skipping {src} -> {dest} Exists')
+            return dest
+        # gfile copies within the same object store are server side, so keep many in flight
+        executor = get_executor('transfer', settings.max_concurrency)
+        return bounded_map(executor, _copy, filenames, dests, limit=settings.max_concurrency)
+
+    @classmethod
+    def get_dest_paths(cls, filenames, directory):
+        # Builds the directory prefix once instead of a File.join/File.base call per file
+        prefix = os.path.join(directory, '')
+        return [prefix + os.path.basename(fname) for fname in filenames]
 
     @classmethod
     def append_ext(cls, filepath, append_key, directory=None, fext=None, abs=True):
@@ -487,40 +619,34 @@ class File(object):
         with gfile(filename, mode) as f:
             return f.read()
 
+    @classmethod
+    def writefile(cls, data, filename, mode='w'):
+        with gfile(filename, mode) as f:
+            f.write(data)
+            f.flush()
+
+    @classmethod
+    def readfiles(cls, filenames, mode='r'):
+        return [File.readfile(filename, mode) for filename in filenames]
+
+    @classmethod
+    def writefiles(cls, data_items, filenames, mode='w'):
+        for data, filename in zip(data_items, filenames):
+            File.writefile(data, filename, mode)
+
     @classmethod
     def open(cls, filename, mode='r', auto=True, device=None, **kwargs):
         if 'r' in mode and auto:
-            if filename.endswith('.pkl'):
-                return File.pload(filename)
-            
-            if filename.endswith('.jsonl') or filename.endswith('.jsonlines'):
-                return File.jg(filename)
-            
-            if filename.endswith('.json'):
-                return File.jsonload(filename)
-            
-            if filename.endswith('.pt'):
-                return File.ptload(filename, device)
-
+            loader = _open_handlers.get(os.path.splitext(filename)[1])
+            if loader:
+                return loader(filename, device)
         return gfile(filename, mode)
     
     @classmethod
     def save(cls, data, filename, overwrite=False):
-        if filename.endswith('.pkl'):
-            return File.pklsave(data, filename)
-        
-        if filename.endswith('.jsonl') or filename.endswith('.jsonlines'):
-            return File.jlw(data, filename)
-        
-        if filename.endswith('.json'):
-            return File.jsondump(data, filename)
-        
-        if filename.endswith('.pt') or filename.endswith('.pb'):
-            return File.ptsave(data, filename)
-        
-        if filename.endswith('.txt'):
-            return File.textwrite(data, filename, overwrite)
-        
+        saver = _save_handlers.get(os.path.splitext(filename)[1])
+        if saver:
+            return saver(data, filename, overwrite)
         logger.info('Unrecognized Extension. Not Saving')
         return
     
@@ -794,29 +920,36 @@ class File(object):
         return File.torchload(filename, device)
     
     # CSV / TSV Methods
+    @classmethod
+    def _delimited_load(cls, filename, delimiter=',', as_dict=False):
+        with gfile(filename, 'r') as f:
+            if as_dict:
+                return dict(csv.DictReader(f, delimiter=delimiter))
+            return list(csv.reader(f, delimiter=delimiter))
+
     @classmethod
     def csvload(cls, filename):
-        return list(csv.reader(gfile(filename, 'r')))
+        return File._delimited_load(filename)
 
     @classmethod
     def tsvload(cls, filename):
-        return list(csv.reader(gfile(filename, 'r'), delimiter='\t'))
+        return File._delimited_load(filename, delimiter='\t')
     
     @classmethod
     def csvdictload(cls, filename):
-        return dict(csv.DictReader(gfile(filename, 'r')))
+        return File._delimited_load(filename, as_dict=True)
 
     @classmethod
     def tsvdictload(cls, filename):
-        return dict(csv.DictReader(gfile(filename, 'r'), delimiter='\t'))
+        return File._delimited_load(filename, delimiter='\t', as_dict=True)
 
     @classmethod
-    def csvreader(cls, f):
-        return csv.DictReader(f)
+    def csvreader(cls, f, delimiter=','):
+        return csv.DictReader(f, delimiter=delimiter)
     
     @classmethod
     def tsvreader(cls, f):
-        return csv.DictReader(f, delimiter='\t')
+        return File.csvreader(f, delimiter='\t')
     
     @classmethod
     def csvwrite(cls, data, filename, mode='auto', keys=None, delimiter=','):
@@ -974,29 +1107,24 @@ class File(object):
     
     # Download Methods
     @classmethod
-    def download(cls, url, dirpath=None, filename=None, overwrite=False, quiet=True, chunk_size=1024):
+    def download(cls, url, dirpath=None, filename=None, overwrite=False, quiet=True, chunk_size=None, session=None):
         if not filename:
             filename = File.base(url)
         if dirpath:
-            File.join(dirpath, filename)
-        if File.exists(filename) and not overwrite:
-            logger.info(f'{filename} exists and overwrite = False')
-            return
-        rstream = requests.get(url, stream=True)
-        with File.wb(filename) as f:
-            for chunk in tqdm(rstream.iter_content(chunk_size=chunk_size), desc=f'Downloading {filename}', disable=(quiet or not _enable_pbar)):
-                if not chunk:
-                    break
-                f.write(chunk)
-            f.flush()
-        f.close()
+            mkdirs(dirpath)
+            filename = File.join(dirpath, filename)
+        return File.absdownload(url, filename, overwrite=overwrite, quiet=quiet, chunk_size=chunk_size, session=session)
     
     @classmethod
-    def absdownload(cls, url, filepath, overwrite=False, quiet=True, chunk_size=1024):
+    def absdownload(cls, url, filepath, overwrite=False, quiet=True, chunk_size=None, session=None):
         if File.exists(filepath) and not overwrite:
             logger.info(f'{filepath} exists and overwrite = False')
             return
-        rstream = requests.get(url, stream=True)
+        session = session or get_session()
+        chunk_size = chunk_size or settings.chunk_size
+        rstream = session.get(url, stream=True)
+        # Error responses raise instead of being written out as file contents
+        rstream.raise_for_status()
         with File.wb(filepath) as f:
             for chunk in tqdm(rstream.iter_content(chunk_size=chunk_size), desc=f'Downloading {filepath}', disable=(quiet or not _enable_pbar)):
                 if not chunk:
@@ -1006,16 +1134,62 @@ class File(object):
         f.close()
 
     @classmethod
-    def batch_download(cls, urls, directory=None, overwrite=False):
+    def configure_transfer(cls, **opts):
+        settings.update_config(**opts)
+        # New session/pool are built on next use so the settings apply; in-flight work keeps the old ones
+        _reset_session()
+        if 'thread_pool_size' in opts:
+            reset_pool()
+        return settings.dict()
+
+    @classmethod
+    def batch_download(cls, urls, directory=None, overwrite=False, session=None, num_workers=None, max_in_flight=None):
         if not directory:
             directory = curdir()
             logger.info(f'No Directory Set. Using: {directory}')
         logger.info(f'Downloading {len(urls)} Urls')
+        return list(File.iter_batch_download(urls, directory=directory, overwrite=overwrite, session=session, num_workers=num_workers, max_in_flight=max_in_flight))
+
+    @classmethod
+    def iter_batch_download(cls, urls, directory=None, overwrite=False, session=None, num_workers=None, max_in_flight=None):
+        directory = directory or curdir()
+        mkdirs(directory)
+        session = session or get_session()
+        num_workers = num_workers or settings.max_concurrency
+        max_in_flight = max_in_flight or num_workers
+        executor = get_executor('transfer', num_workers)
+        prefix = os.path.join(directory, '')
+        # Only max_in_flight transfers are held at once, which bounds memory for very large url iterators
+        # and this call's parallelism on the shared pool.
+        # Results are yielded in completion order so one slow file does not hold back new submissions.
+        inflight = {}
+        error = None
         for url in urls:
+            filepath = prefix + os.path.basename(url)
             try:
-                File.download(url, dirpath=directory, overwrite=overwrite)
-            except Exception as e:
-                logger.info(f'Failed to download {url}: {str(e)}')
+                task = executor.submit(File.absdownload, url, filepath, overwrite=overwrite, session=session)
+            except RuntimeError as e:
+                # The pool can no longer take work (interpreter shutdown), report what is in flight before raising
+                logger.error(f'Unable to schedule {url}: {str(e)}')
+                error = e
+                break
+            inflight[task] = (url, filepath)
+            if len(inflight) >= max_in_flight:
+                done, _ = futures.wait(inflight, return_when=futures.FIRST_COMPLETED)
+                for task in done:
+                    yield File._finish_download(*inflight.pop(task), task)
+        for task in futures.as_completed(inflight):
+            yield File._finish_download(*inflight[task], task)
+        if error is not None:
+            raise error
+
+    @classmethod
+    def _finish_download(cls, url, filepath, task):
+        try:
+            task.result()
+        except Exception as e:
+            logger.info(f'Failed to download {url}: {str(e)}')
+        return filepath
     
     @classmethod
     def gurl(cls, url_or_id):
@@ -1026,6 +1200,7 @@ class File(object):
 
     @classmethod
     def gdown(cls, url, extract=True, verbose=False):
+        gdownload = lazy_import('gdown')
         url = File.gurl(url)
         if extract:
             return gdownload.cached_download(url, postprocess=gdownload.extractall, quiet=verbose)
@@ -1045,6 +1220,127 @@ class File(object):
             except Exception as e:
                 logger.info(f'Failed to download {url}: {str(e)}')
 
+    # Async Methods
+    @classmethod
+    async def async_download(cls, url, dirpath=None, filename=None, overwrite=False, quiet=True, chunk_size=None, session=None):
+        return await to_thread(File.download, url, dirpath=dirpath, filename=filename, overwrite=overwrite, quiet=quiet, chunk_size=chunk_size, session=session)
+
+    @classmethod
+    async def async_absdownload(cls, url, filepath, overwrite=False, quiet=True, chunk_size=None, session=None):
+        return await to_thread(File.absdownload, url, filepath, overwrite=overwrite, quiet=quiet, chunk_size=chunk_size, session=session)
+
+    @classmethod
+    async def async_copy(cls, src, dest, overwrite=True):
+        return await to_thread(File.copy, src, dest, overwrite)
+
+    @classmethod
+    async def async_exists(cls, filepath):
+        return await to_thread(exists, filepath)
+
+    @classmethod
+    async def async_batch_rm(cls, filenames, batch_size=1000):
+        return await to_thread(File.batch_rm, filenames, batch_size)
+
+    # open + read/write + close run as a single thread hop
+    @classmethod
+    async def async_readfile(cls, filename, mode='r'):
+        return await to_thread(File.readfile, filename, mode)
+
+    @classmethod
+    async def async_read_text(cls, filename):
+        return await to_thread(File.readfile, filename, 'r')
+
+    @classmethod
+    async def async_read_bytes(cls, filename):
+        return await to_thread(File.readfile, filename, 'rb')
+
+    @classmethod
+    async def async_writefile(cls, data, filename, mode='w'):
+        return await to_thread(File.writefile, data, filename, mode)
+
+    @classmethod
+    async def async_write_text(cls, data, filename):
+        return await to_thread(File.writefile, data, filename, 'w')
+
+    @classmethod
+    async def async_write_bytes(cls, data, filename):
+        return await to_thread(File.writefile, data, filename, 'wb')
+
+    # Many small files are grouped so each thread hop serves a whole batch
+    @classmethod
+    async def async_readfiles(cls, filenames, mode='r', batch_size=64):
+        filenames = list(filenames)
+        batches = [filenames[i:i + batch_size] for i in range(0, len(filenames), batch_size)]
+        results = await asyncio.gather(*[to_thread(File.readfiles, batch, mode) for batch in batches])
+        return [data for batch in results for data in batch]
+
+    @classmethod
+    async def async_writefiles(cls, data_items, filenames, mode='w', batch_size=64):
+        data_items, filenames = list(data_items), list(filenames)
+        await asyncio.gather(*[to_thread(File.writefiles, data_items[i:i + batch_size], filenames[i:i + batch_size], mode) for i in range(0, len(filenames), batch_size)])
+
+    @classmethod
+    async def async_batch_download(cls, urls, directory=None, overwrite=False, session=None, concurrency=None, use_aiohttp=False, read_timeout=60):
+        if not directory:
+            directory = curdir()
+            logger.info(f'No Directory Set. Using: {directory}')
+        logger.info(f'Downloading {len(urls)} Urls')
+        if use_aiohttp and not _aiohttp_avail:
+            logger.warning('aiohttp is not installed. Falling back to threaded downloads')
+            use_aiohttp = False
+        await to_thread(mkdirs, directory)
+        filepaths = File.get_dest_paths(urls, directory)
+        skip = await asyncio.gather(*[File.async_exists(f) for f in filepaths]) if not overwrite else [False] * len(urls)
+        pending = [(url, filepath) for url, filepath, exists_ in zip(urls, filepaths, skip) if not exists_]
+        if use_aiohttp:
+            aiohttp = lazy_import('aiohttp')
+            # A requests session from the caller means they want it used, so keep the threaded path
+            use_aiohttp = session is None or isinstance(session, aiohttp.ClientSession)
+        concurrency = concurrency or settings.max_concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+        if use_aiohttp:
+            # One event loop task per file sharing a single connection pool, no thread per request
+            if isinstance(session, aiohttp.ClientSession):
+                results = await asyncio.gather(*[File._aiohttp_download(session, semaphore, url, filepath) for url, filepath in pending], return_exceptions=True)
+            else:
+                # No total timeout so large files are not cut off, only stalled reads fail
+                timeout = aiohttp.ClientTimeout(total=None, sock_read=read_timeout)
+                async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency), timeout=timeout) as client:
+                    results = await asyncio.gather(*[File._aiohttp_download(client, semaphore, url, filepath) for url, filepath in pending], return_exceptions=True)
+        else:
+            session = session or get_session()
+            async def _download(url, filepath):
+                async with semaphore:
+                    return await File.async_absdownload(url, filepath, overwrite=True, session=session)
+            results = await asyncio.gather(*[_download(url, filepath) for url, filepath in pending], return_exceptions=True)
+        for (url, _), res in zip(pending, results):
+            if isinstance(res, Exception):
+                logger.info(f'Failed to download {url}: {str(res)}')
+        return filepaths
+
+    @classmethod
+    async def _aiohttp_download(cls, client, semaphore, url, filepath):
+        async with semaphore:
+            async with client.get(url) as resp:
+                resp.raise_for_status()
+                f = await to_thread(File.wb, filepath)
+                try:
+                    async for chunk in resp.content.iter_chunked(settings.chunk_size):
+                        await to_thread(f.write, chunk)
+                finally:
+                    await to_thread(f.close)
+        return filepath
+
+    @classmethod
+    async def async_get_local(cls, filenames, directory=None, overwrite=False):
+        if not directory:
+            directory = File.join(curdir(), 'data')
+        filenames = await to_thread(File.fsorter, filenames)
+        await to_thread(mkdirs, directory)
+        lpaths = File.get_dest_paths(filenames, directory)
+        await asyncio.gather(*[to_thread(File._gcopy, fpath, lpath, overwrite) for fpath, lpath in zip(filenames, lpaths)])
+        return lpaths
+
     # Web Utils
     @classmethod
     def reqsess(cls, headers=None, cookies=None):
@@ -1067,7 +1363,8 @@ class File(object):
 
     @classmethod
     def getreq(cls, url, method, headers=None, params=None, data=None, json_data=None, auth=None, cookies=None, filepath=None):
-        assert method.upper() in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD']
+        method = method.upper()
+        assert method in _req_methods
         rparams = {'url': requests.utils.quote(url)}
         if cookies:
             if isinstance(cookies, dict):
@@ -1083,7 +1380,7 @@ class File(object):
             rparams['json'] = json_data
         if filepath:
             rparams['files'] = (File.base(filepath), File.rb(filepath))
-        return requests.request(method.upper(), **rparams)
+        return requests.request(method, **rparams)
         
     @classmethod
     def rget(cls, url, headers=None, params=None, data=None, json_data=None, auth=None, cookies=None):
@@ -1239,14 +1536,16 @@ class File(object):
             File.copy(src_dict[key], dest_dict[key], overwrite=overwrite)
     
     @classmethod
-    def get_local(cls, filenames, directory=None, overwrite=False):
+    def get_local(cls, filenames, directory=None, overwrite=False, num_workers=None):
         if not directory:
             directory = File.join(curdir(), 'data')
         filenames = File.fsorter(filenames)
-        lpaths = []
-        for fpath in filenames:
-            lpath = File.bcopy(fpath, directory, overwrite=overwrite)
-            lpaths.append(lpath)
+        num_workers = num_workers or settings.max_concurrency
+        if not exists(directory):
+            mkdirs(directory)
+        lpaths = File.get_dest_paths(filenames, directory)
+        executor = get_executor('transfer', num_workers)
+        bounded_map(executor, lambda fpath, lpath: File._gcopy(fpath, lpath, overwrite), filenames, lpaths, limit=num_workers)
         return lpaths
     
     @classmethod
@@ -1313,20 +1612,7 @@ class File(object):
 
         res_meta = {'filename': filename, 'output_files': out_fns}
         res_meta.update(split_data)
-        for split_key in split_dict:
-            items = [lazy_iterator[i] for i in data_idx[split_key]]
-            if output_format in ['jsonl', 'jsonlines', 'jl', 'jlines']:
-                File.jlwrites(items, out_fns[split_key], mode='w')
-            
-            else:
-                logger.error(f'Format {output_format} is not supported')
-                assert ValueError
-            del items
-            gc.collect()
-            
-        logger.info(f'Final Metadata: {res_meta}')
-        File.jsondump(res_meta, out_fns['results'])
-        return res_meta
+        return File._write_splits(lambda k: (lazy_iterator[i] for i in data_idx[k]), split_dict, out_fns, res_meta, output_format)
 
 
     @classmethod
@@ -1342,17 +1628,7 @@ class File(object):
 
         res_meta = {'filename': filename, 'output_files': out_fns}
         res_meta.update(split_data)
-        for split_key in split_dict:
-            if output_format in ['jsonl', 'jsonlines', 'jl', 'jlines']:
-                File.jlwrites(data[split_key], out_fns[split_key], mode='w')
-            
-            else:
-                logger.error(f'Format {output_format} is not supported')
-                assert ValueError
-            
-        logger.info(f'Final Metadata: {res_meta}')
-        File.jsondump(res_meta, out_fns['results'])
-        return res_meta
+        return File._write_splits(lambda k: data[k], split_dict, out_fns, res_meta, output_format)
 
     @classmethod
     def split_files(cls, filenames, split_dict={'train': 0.85, 'val': 0.15, 'test': 0.05}, output_format='jsonl', merge_files=False, dataset_name=None, directory=None, shuffle=True):
@@ -1373,15 +1649,15 @@ class File(object):
 
         res_meta = {'filenames': filenames, 'total_files': len(filenames), 'output_files': out_fns}
         res_meta.update(split_data)
+        return File._write_splits(lambda k: data[k], split_dict, out_fns, res_meta, output_format)
 
-        for split_key in split_dict:
-            if output_format in ['jsonl', 'jsonlines', 'jl', 'jlines']:
-                File.jlwrites(data[split_key], out_fns[split_key], mode='w')
-            
-            else:
-                logger.error(f'Format {output_format} is not supported')
-                assert ValueError
-            
+    @classmethod
+    def _write_splits(cls, get_split, split_dict, out_fns, res_meta, output_format='jsonl'):
+        if output_format in _jsonl_formats:
+            for split_key in split_dict:
+                File.jlwrites(get_split(split_key), out_fns[split_key], mode='w')
+        else:
+            logger.error(f'Format {output_format} is not supported')
         logger.info(f'Final Metadata: {res_meta}')
         File.jsondump(res_meta, out_fns['results'])
         return res_meta
@@ -1393,6 +1669,26 @@ class File(object):
         return gfile(filename, mode)
 
 
+# Extension -> handler tables for File.open / File.save
+_open_handlers = {
+    '.pkl': lambda filename, device: File.pload(filename),
+    '.jsonl': lambda filename, device: File.jg(filename),
+    '.jsonlines': lambda filename, device: File.jg(filename),
+    '.json': lambda filename, device: File.jsonload(filename),
+    '.pt': lambda filename, device: File.ptload(filename, device),
+}
+
+_save_handlers = {
+    '.pkl': lambda data, filename, overwrite: File.pklsave(data, filename),
+    '.jsonl': lambda data, filename, overwrite: File.jlw(data, filename),
+    '.jsonlines': lambda data, filename, overwrite: File.jlw(data, filename),
+    '.json': lambda data, filename, overwrite: File.jsondump(data, filename),
+    '.pt': lambda data, filename, overwrite: File.ptsave(data, filename),
+    '.pb': lambda data, filename, overwrite: File.ptsave(data, filename),
+    '.txt': lambda data, filename, overwrite: File.textwrite(data, filename, overwrite),
+}
+
+
 def iterator_function(function=None, **kwargs):
     assert function is not None, "Please supply a function"
     def inner_func(function=function, **kwargs):
@@ -21,10 +21,16 @@ _PATHLIKE_CLS: Tuple[PathLikeCls, ...] = (
     gpath.PosixGPath,
     gpath.WindowsGPath,
 )
-_URI_PREFIXES_TO_CLS: Dict[str, PathLikeCls] = {
+# Keyed by scheme (`gs`, `s3`,...) so `as_path` can look up the class without
+# rebuilding the `scheme://` prefix string.
+_URI_SCHEMES_TO_CLS: Dict[str, PathLikeCls] = {
     # Even on Windows, `gs://`,... are PosixPath
-    uri_prefix: gpath.PosixGPath for uri_prefix in gpath.URI_PREFIXES
+    uri_prefix.split('://', 1)[0]: gpath.PosixGPath for uri_prefix in gpath.URI_PREFIXES
 }
+# Local path class for the current system, resolved once rather than per call.
+_LOCAL_PATH_CLS: PathLikeCls = (
+    gpath.WindowsGPath if os.name == 'nt' else gpath.PosixGPath
+)
 
 
 # pylint: disable=g-wrong-blank-lines
@@ -56,7 +62,7 @@ def register_pathlike_cls(path_cls_or_uri_prefix):
     if isinstance(path_cls_or_uri_prefix, str):
 
         def register_pathlike_decorator(cls: T) -> T:
-            _URI_PREFIXES_TO_CLS[path_cls_or_uri_prefix] = cls
+            _URI_SCHEMES_TO_CLS[path_cls_or_uri_prefix.split('://', 1)[0]] = cls
             return register_pathlike_cls(cls)
 
         return register_pathlike_decorator
@@ -78,21 +84,17 @@ def as_path(path: PathLike) -> ReadWritePath:
     Returns:
         path: The `pathlib.Path`-like abstraction.
     """
-    is_windows = os.name == 'nt'
     if isinstance(path, str):
-        uri_splits = path.split('://', maxsplit=1)
-        if len(uri_splits) > 1:    # str is URI (e.g. `gs://`, `github://`,...)
+        uri_scheme, uri_sep, _ = path.partition('://')
+        if uri_sep:    # str is URI (e.g. `gs://`, `github://`,...)
             # On windows, `PosixGPath` is created for `gs://` paths
-            return _URI_PREFIXES_TO_CLS[uri_splits[0] + '://'](path)    # pytype: disable=bad-return-type
-        elif is_windows:
-            return gpath.WindowsGPath(path)
+            return _URI_SCHEMES_TO_CLS[uri_scheme](path)    # pytype: disable=bad-return-type
         else:
-            return gpath.PosixGPath(path)
+            return _LOCAL_PATH_CLS(path)
     elif isinstance(path, _PATHLIKE_CLS):
         return path    # Forward resource path, gpath,... as-is    # pytype: disable=bad-return-type
     elif isinstance(path, os.PathLike):    # Other `os.fspath` compatible objects
-        path_cls = gpath.WindowsGPath if is_windows else gpath.PosixGPath
-        return path_cls(path)
+        return _LOCAL_PATH_CLS(path)
     else:
         raise TypeError(f'Invalid path type: {path!r}')
 
@@ -37,6 +37,13 @@ class _GPath(pathlib.PurePath, type_utils.ReadWritePath):
     # Do not use `os.path`, so `PosixGPath('gs://abc')` works on windows.
     _PATH: ClassVar[types.ModuleType]
 
+    # Derived values are cached on first use, the same way `PurePath` lazily
+    # caches its own `_str`/`_hash` slots. This does not change a path's
+    # encoded form: `PurePath.__reduce__` only serialises `parts`, so a pickled
+    # path (what beam compares for mutable inputs) is identical before and
+    # after the cache is filled.
+    __slots__ = ('_cached_path_str', '_cached_uri_scheme')
+
     def __new__(cls: Type[_P], *parts: type_utils.PathLike) -> _P:
         full_path = '/'.join(os.fspath(p) for p in parts)
         if not full_path.startswith(URI_PREFIXES):
@@ -50,24 +57,35 @@ class _GPath(pathlib.PurePath, type_utils.ReadWritePath):
         """Create a new `Path` child of same type."""
         return type(self)(*parts)
 
-    # Could try to use `cached_property` when beam is compatible (currently
-    # raise mutable input error).
+    # Cached in a slot like `_path_str`, see the `__slots__` note above.
     @property
     def _uri_scheme(self) -> Optional[str]:
-        if (len(self.parts) >= 2 and self.parts[0] == '/' and
-                self.parts[1] in _URI_SCHEMES):
-            return self.parts[1]
+        try:
+            return self._cached_uri_scheme
+        except AttributeError:
+            pass
+        parts = self.parts
+        if len(parts) >= 2 and parts[0] == '/' and parts[1] in _URI_SCHEMES:
+            uri_scheme = parts[1]
         else:
-            return None
+            uri_scheme = None
+        self._cached_uri_scheme = uri_scheme
+        return uri_scheme
 
     @property
     def _path_str(self) -> str:
         """Returns the `__fspath__` string representation."""
+        try:
+            return self._cached_path_str
+        except AttributeError:
+            pass
         uri_scheme = self._uri_scheme
         if uri_scheme:    # pylint: disable=using-constant-test
-            return self._PATH.join(f'{uri_scheme}://', *self.parts[2:])
+            path_str = self._PATH.join(f'{uri_scheme}://', *self.parts[2:])
         else:
-            return self._PATH.join(*self.parts) if self.parts else '.'
+            path_str = self._PATH.join(*self.parts) if self.parts else '.'
+        self._cached_path_str = path_str
+        return path_str
 
     def __fspath__(self) -> str:
         return self._path_str
@@ -219,7 +237,8 @@ class _GPath(pathlib.PurePath, type_utils.ReadWritePath):
             for _ in range(1, levels): pattern += '/*'
         if self.is_dir() and not pattern.startswith('/'): pattern = '*/' + pattern
         fiter = curdir.glob(pattern) if mode == 'shallow' else curdir.rglob(pattern)
-        fnames = [f for f in fiter if not bool(set(f.parts).intersection(ignore))]
+        ignore = frozenset(ignore)
+        fnames = [f for f in fiter if ignore.isdisjoint(f.parts)]
         print(len(fnames))
         for f in fnames:
             dest_path = dst.joinpath(f.relative_to(curdir))
@@ -232,7 +251,8 @@ class _GPath(pathlib.PurePath, type_utils.ReadWritePath):
         return copied_files
 
     def listdir(self: _P, ignore=['.git'], skip_dirs=True, skip_files=False):
-        fnames = [f for f in self.iterdir() if not bool(set(f.parts).intersection(ignore))]
+        ignore = frozenset(ignore)
+        fnames = [f for f in self.iterdir() if ignore.isdisjoint(f.parts)]
         fnames = [f.resolve() for f in fnames]
         if skip_dirs:
             return [f for f in fnames if f.is_file()]
@@ -252,7 +272,8 @@ class _GPath(pathlib.PurePath, type_utils.ReadWritePath):
         if self.is_dir() and not pattern.startswith('*/'): pattern = '*/' + pattern
         print(pattern)
         fiter = curdir.glob(pattern) if mode == 'shallow' else curdir.rglob(pattern)
-        fnames = [f for f in fiter if not bool(set(f.parts).intersection(ignore))]
+        ignore = frozenset(ignore)
+        fnames = [f for f in fiter if ignore.isdisjoint(f.parts)]
         print(len(fnames))
         if skip_dirs:
             return [f for f in fnames if f.is_file()]
@@ -0,0 +1,65 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from fileio.utils import ops
+from fileio.utils.ops import Auth
+
+
+class AuthCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        self.auth_file = os.path.join(directory, 'config.json')
+        self.now = 100.0
+        patches = [
+            mock.patch.object(ops, 'auth_file', self.auth_file),
+            mock.patch.object(ops, '_auth_data', None),
+            mock.patch.object(ops, '_auth_expiry', 0.0),
+            mock.patch.object(ops.time, 'monotonic', lambda: self.now),
+            mock.patch.dict(os.environ, {}, clear=False),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write(self, data):
+        with open(self.auth_file, 'w') as f:
+            json.dump(data, f)
+
+    def test_missing_file_loads_empty(self):
+        self.assertEqual(Auth.load(), {})
+
+    def test_load_is_cached_until_ttl(self):
+        self.write({'project': 'one'})
+        self.assertEqual(Auth.load(), {'project': 'one'})
+        self.write({'project': 'two'})
+        self.now += ops.auth_ttl - 1
+        self.assertEqual(Auth.load(), {'project': 'one'})
+        self.now += 2
+        self.assertEqual(Auth.load(), {'project': 'two'})
+
+    def test_load_returns_a_copy(self):
+        self.write({'project': 'one'})
+        Auth.load()['project'] = 'changed'
+        self.assertEqual(Auth.load(), {'project': 'one'})
+
+    def test_save_refreshes_cache(self):
+        Auth.save({'project': 'saved'})
+        with open(self.auth_file) as f:
+            self.assertEqual(json.load(f), {'project': 'saved'})
+        with mock.patch('builtins.open', side_effect=AssertionError('should not read')):
+            self.assertEqual(Auth.load(), {'project': 'saved'})
+
+    def test_init_exports_env(self):
+        Auth(adc='/creds.json', project='proj')
+        self.assertEqual(os.environ[ops.auth_vars['adc']], '/creds.json')
+        self.assertEqual(os.environ[ops.auth_vars['gproject']], 'proj')
+        self.assertEqual(Auth.load(), {'adc': '/creds.json', 'project': 'proj'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import pickle
+import unittest
+
+from fileio.src.gpath import PosixGPath
+
+
+class CachedPathTest(unittest.TestCase):
+    def test_path_str_cache_does_not_change_encoding(self):
+        path = PosixGPath('gs://bucket/dir/file.txt')
+        before = pickle.dumps(path)
+        self.assertEqual(str(path), 'gs://bucket/dir/file.txt')
+        self.assertEqual(pickle.dumps(path), before)
+
+    def test_path_str_survives_round_trip(self):
+        path = PosixGPath('gs://bucket/dir/file.txt')
+        str(path)
+        restored = pickle.loads(pickle.dumps(path))
+        self.assertEqual(str(restored), 'gs://bucket/dir/file.txt')
+        self.assertEqual(restored, path)
+        self.assertEqual(str(PosixGPath('a/b')), 'a/b')
+        self.assertEqual(str(PosixGPath()), '.')
+
+    def test_uri_scheme_cache_does_not_change_encoding(self):
+        path = PosixGPath('s3://bucket/file.txt')
+        before = pickle.dumps(path)
+        self.assertTrue(path.is_s3)
+        self.assertFalse(path.is_gcs)
+        self.assertEqual(pickle.dumps(path), before)
+        self.assertFalse(PosixGPath('/tmp/file.txt').is_cloud)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import threading
+import time
+import unittest
+
+from fileio.utils import multi
+from fileio.utils.multi import get_executor, bounded_map
+
+
+class GetExecutorTest(unittest.TestCase):
+    def test_reuses_pool_per_name(self):
+        executor = get_executor('test_reuse', 4)
+        self.assertIs(executor, get_executor('test_reuse', 4))
+        self.assertIs(executor, get_executor('test_reuse', 2))
+
+    def test_larger_request_keeps_old_pool_usable(self):
+        old = get_executor('test_resize', 2)
+        new = get_executor('test_resize', 4)
+        self.assertIsNot(old, new)
+        self.assertIs(new, get_executor('test_resize', 3))
+        self.assertEqual(old.submit(lambda: 1).result(), 1)
+        self.assertEqual(multi._executors['test_resize'][0], 4)
+
+
+class BoundedMapTest(unittest.TestCase):
+    def test_limits_parallelism_and_keeps_order(self):
+        lock = threading.Lock()
+        running = {'now': 0, 'peak': 0}
+        def work(x):
+            with lock:
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+            time.sleep(0.01)
+            with lock:
+                running['now'] -= 1
+            return x * 2
+        executor = get_executor('test_bounded', 8)
+        self.assertEqual(bounded_map(executor, work, range(20), limit=2), [x * 2 for x in range(20)])
+        self.assertLessEqual(running['peak'], 2)
+
+    def test_multiple_iterables(self):
+        executor = get_executor('test_bounded', 8)
+        self.assertEqual(bounded_map(executor, lambda a, b: a + b, [1, 2], [10, 20], limit=1), [11, 22])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest import mock
+
+from fileio.src import core
+from fileio.src.core import File, tf
+
+
+class BatchRmTest(unittest.TestCase):
+    def setUp(self):
+        self.objects = {'gs://b/a.json', 'gs://b/b.json', 'gs://b/c.txt', 'gs://b/d.txt', 'gs://b/e.txt'}
+        self.removed = []
+        self.runs = []
+        self.returncode = 0
+        def glob(pattern):
+            prefix, _, suffix = pattern.partition('*')
+            return sorted(o for o in self.objects if o.startswith(prefix) and o.endswith(suffix))
+        def rm(filename):
+            if filename not in self.objects:
+                raise tf.errors.NotFoundError(None, None, filename)
+            self.objects.discard(filename)
+            self.removed.append(filename)
+        def run(argv, **kwargs):
+            self.runs.append(argv)
+            return mock.Mock(returncode=self.returncode)
+        for name, value in [('glob', glob), ('rm', rm), ('exists', lambda f: f in self.objects), ('isfile', lambda f: f in self.objects), ('check_gsutil', lambda: None)]:
+            patcher = mock.patch.object(core, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(core.subprocess, 'run', run)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_batches_names_as_argv(self):
+        failed = File.batch_rm(['gs://b/*'], batch_size=2)
+        self.assertEqual(failed, [])
+        self.assertEqual([len(argv) - 4 for argv in self.runs], [2, 2, 1])
+        self.assertTrue(all(argv[:4] == ['gsutil', '-m', '-q', 'rm'] for argv in self.runs))
+
+    def test_expands_inner_wildcards(self):
+        File.batch_rm('gs://b/*.json')
+        self.assertEqual(self.runs, [['gsutil', '-m', '-q', 'rm', 'gs://b/a.json', 'gs://b/b.json']])
+
+    def test_missing_explicit_name_is_reported(self):
+        failed = File.batch_rm(['gs://b/a.json', 'gs://b/typo.json'])
+        self.assertEqual([f['filename'] for f in failed], ['gs://b/typo.json'])
+        self.assertEqual(self.runs, [['gsutil', '-m', '-q', 'rm', 'gs://b/a.json']])
+
+    def test_failed_batch_only_reports_objects_still_present(self):
+        # gsutil removes everything it can, then fails on c.txt
+        def run(argv, **kwargs):
+            self.runs.append(argv)
+            self.objects.difference_update(f for f in argv[4:] if f != 'gs://b/c.txt')
+            return mock.Mock(returncode=1)
+        def rm(filename):
+            if filename == 'gs://b/c.txt':
+                raise PermissionError('denied')
+            if filename not in self.objects:
+                raise tf.errors.NotFoundError(None, None, filename)
+            self.objects.discard(filename)
+        with mock.patch.object(core.subprocess, 'run', run), mock.patch.object(core, 'rm', rm):
+            failed = File.batch_rm(['gs://b/c.txt', 'gs://b/*.json'])
+        self.assertEqual([f['filename'] for f in failed], ['gs://b/c.txt'])
+        self.assertEqual(self.objects, {'gs://b/c.txt', 'gs://b/d.txt', 'gs://b/e.txt'})
+
+    def test_local_files_are_removed_directly(self):
+        self.objects.add('/tmp/local.txt')
+        failed = File.batch_rm(['/tmp/local.txt', '/tmp/other.txt'])
+        self.assertEqual(self.removed, ['/tmp/local.txt'])
+        self.assertEqual([f['filename'] for f in failed], ['/tmp/other.txt'])
+        self.assertEqual(self.runs, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
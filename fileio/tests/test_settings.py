@@ -0,0 +1,52 @@
+import os
+import unittest
+from unittest import mock
+
+from fileio.utils.configs import FileIOSettings, LazySettings
+
+
+class FileIOSettingsTest(unittest.TestCase):
+    def test_from_env_converts_types(self):
+        env = {'FILEIO_DOWNLOAD_CHUNKSIZE': '4096', 'FILEIO_HTTP_MAX_RETRIES': '5'}
+        with mock.patch.dict(os.environ, env):
+            config = FileIOSettings.from_env()
+        self.assertEqual(config.chunk_size, 4096)
+        self.assertEqual(config.max_retries, 5)
+        self.assertEqual(config.pool_size, FileIOSettings().pool_size)
+
+    def test_from_env_rejects_bad_values(self):
+        with mock.patch.dict(os.environ, {'FILEIO_MAX_CONCURRENCY': 'lots'}):
+            with self.assertRaises(ValueError):
+                FileIOSettings.from_env()
+
+    def test_update_config_converts_types(self):
+        config = FileIOSettings()
+        config.update_config(chunk_size='4096', pool_size=8)
+        self.assertEqual(config.chunk_size, 4096)
+        self.assertIsInstance(config.chunk_size, int)
+        self.assertEqual(config.pool_size, 8)
+
+    def test_update_config_rejects_bad_values_without_partial_update(self):
+        config = FileIOSettings()
+        with self.assertRaises(ValueError):
+            config.update_config(pool_size='8', chunk_size='big')
+        self.assertEqual(config.pool_size, FileIOSettings().pool_size)
+        self.assertEqual(config.chunk_size, FileIOSettings().chunk_size)
+
+    def test_update_config_rejects_unknown_keys(self):
+        with self.assertRaises(ValueError):
+            FileIOSettings().update_config(chunksize=1)
+
+
+class LazySettingsTest(unittest.TestCase):
+    def test_reads_env_on_first_access(self):
+        lazy = LazySettings()
+        with mock.patch.dict(os.environ, {'FILEIO_HTTP_POOL_SIZE': '3'}):
+            self.assertEqual(lazy.pool_size, 3)
+        self.assertEqual(lazy.pool_size, 3)
+        lazy.pool_size = 7
+        self.assertEqual(lazy.dict()['pool_size'], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from fileio.src import core
+from fileio.src.core import File
+
+
+class IterBatchDownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+        self.urls = [f'http://host/f{i}.txt' for i in range(12)]
+        self.expected = [os.path.join(self.directory, os.path.basename(u)) for u in self.urls]
+
+    def test_interleaved_get_local_does_not_break_iteration(self):
+        # get_local with a different worker count inside the loop must not invalidate the generator's pool
+        with mock.patch.object(File, 'absdownload', lambda url, filepath, overwrite=False, session=None: None), \
+                mock.patch.object(File, '_gcopy', lambda src, dest, overwrite=False: True), \
+                mock.patch.object(File, 'fsorter', lambda filenames: list(filenames)):
+            results = []
+            gen = File.iter_batch_download(self.urls, directory=self.directory, session=object(), num_workers=2)
+            for i, path in enumerate(gen):
+                results.append(path)
+                File.get_local(['gs://b/a', 'gs://b/b'], directory=self.directory, num_workers=3 + i)
+        self.assertEqual(sorted(results), sorted(self.expected))
+
+    def test_slow_head_does_not_block_later_transfers(self):
+        release = threading.Event()
+        def download(url, filepath, overwrite=False, session=None):
+            if url.endswith('f0.txt'):
+                release.wait(5)
+        with mock.patch.object(File, 'absdownload', download):
+            results = []
+            for path in File.iter_batch_download(self.urls, directory=self.directory, session=object(), num_workers=2):
+                results.append(path)
+                if len(results) == 5:
+                    release.set()
+        self.assertEqual(sorted(results), sorted(self.expected))
+        self.assertNotEqual(results[0], self.expected[0])
+
+    def test_submit_failure_reports_inflight_then_raises(self):
+        pool = core.get_executor('transfer', 2)
+        calls = []
+        class Executor:
+            def submit(self, *args, **kwargs):
+                calls.append(args)
+                if len(calls) == 3:
+                    raise RuntimeError('cannot schedule new futures after shutdown')
+                return pool.submit(*args, **kwargs)
+        results = []
+        with mock.patch.object(File, 'absdownload', lambda url, filepath, overwrite=False, session=None: None), \
+                mock.patch.object(core, 'get_executor', lambda name, max_workers=None: Executor()):
+            with self.assertRaises(RuntimeError):
+                for path in File.iter_batch_download(self.urls, directory=self.directory, session=object(), num_workers=4):
+                    results.append(path)
+        self.assertEqual(sorted(results), sorted(self.expected[:2]))
+
+
+class _Response:
+    def __init__(self, status, body=b''):
+        self.status, self.body = status, body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise IOError(f'{self.status} Error')
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+
+class _Session:
+    def __init__(self, status=200):
+        self.status = status
+
+    def get(self, url, stream=True):
+        return _Response(self.status, url.encode())
+
+
+class DownloadTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, True)
+
+    def test_error_response_raises_without_writing(self):
+        filepath = os.path.join(self.directory, 'missing.txt')
+        with self.assertRaises(IOError):
+            File.absdownload('http://host/missing.txt', filepath, session=_Session(404))
+        self.assertFalse(os.path.exists(filepath))
+
+    def test_download_creates_dirpath(self):
+        dirpath = os.path.join(self.directory, 'new')
+        File.download('http://host/a.txt', dirpath=dirpath, session=_Session())
+        with open(os.path.join(dirpath, 'a.txt'), 'rb') as f:
+            self.assertEqual(f.read(), b'http://host/a.txt')
+
+    def test_async_batch_download_honours_concurrency(self):
+        lock = threading.Lock()
+        running = {'now': 0, 'peak': 0}
+        def download(url, filepath, overwrite=False, quiet=True, chunk_size=None, session=None):
+            with lock:
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+            time.sleep(0.01)
+            with lock:
+                running['now'] -= 1
+        urls = [f'http://host/f{i}.txt' for i in range(12)]
+        with mock.patch.object(File, 'absdownload', download):
+            paths = asyncio.run(File.async_batch_download(urls, directory=self.directory, session=_Session(), concurrency=2))
+        self.assertEqual(len(paths), len(urls))
+        self.assertLessEqual(running['peak'], 2)
+
+    def test_async_batch_download_skips_error_responses(self):
+        urls = ['http://host/a.txt']
+        asyncio.run(File.async_batch_download(urls, directory=self.directory, session=_Session(500)))
+        self.assertFalse(os.path.exists(os.path.join(self.directory, 'a.txt')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,13 +5,38 @@ from .logging import get_logger
 logger = get_logger()
 _enable_pbar = False
 
+from . import configs
+from .configs import FileIOSettings, LazySettings, settings
+
 from . import ops
-from .ops import Auth, lazy_import, lazy_check, exec_command, lazy_install, gsutil_exec
+from .ops import Auth, lazy_import, lazy_check, module_avail, exec_command, lazy_install, gsutil_exec
 
 from . import multi
-from .multi import MultiThreadPipeline
+from .multi import MultiThreadPipeline, get_executor, bounded_map
+
+from . import aio
+from .aio import to_thread, reset_pool
 
 from . import ds
 from .ds import TFDSIODataset
 
-
+__all__ = [
+    "logger",
+    "get_logger",
+    "FileIOSettings",
+    "LazySettings",
+    "settings",
+    "Auth",
+    "lazy_import",
+    "lazy_check",
+    "module_avail",
+    "lazy_install",
+    "exec_command",
+    "gsutil_exec",
+    "MultiThreadPipeline",
+    "get_executor",
+    "bounded_map",
+    "to_thread",
+    "reset_pool",
+    "TFDSIODataset",
+]
@@ -0,0 +1,40 @@
+import asyncio
+import functools
+import threading
+from concurrent import futures
+
+from .configs import settings
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    # IO bound workloads need far more threads than asyncio's default of min(32, cpu + 4)
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = futures.ThreadPoolExecutor(max_workers=settings.thread_pool_size, thread_name_prefix='fileio')
+    return _pool
+
+
+def reset_pool():
+    # Drops the current pool so the next call builds one with the current settings;
+    # work already queued on the old pool still runs to completion.
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False)
+
+
+async def to_thread(func, *args, **kwargs):
+    """
+    Runs a blocking function in the fileio thread pool so it does not stall the running event loop
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pool or get_pool()
+    if not kwargs:
+        return await loop.run_in_executor(pool, func, *args)
+    return await loop.run_in_executor(pool, functools.partial(func, *args, **kwargs))
@@ -0,0 +1,81 @@
+import os
+from dataclasses import dataclass, asdict, fields
+from typing import ClassVar, Dict
+
+_cores = os.cpu_count() or 1
+
+
+@dataclass
+class FileIOSettings:
+    """
+    Runtime tunables for fileio. Each field can be set through its env var in `_ENV_MAP`
+    """
+    chunk_size: int = 1024 * 1024
+    max_concurrency: int = max(10, _cores * 2)
+    pool_size: int = max(10, _cores * 2)
+    max_retries: int = 3
+    thread_pool_size: int = min(64, _cores * 4)
+
+    _ENV_MAP: ClassVar[Dict[str, str]] = {
+        'chunk_size': 'FILEIO_DOWNLOAD_CHUNKSIZE',
+        'max_concurrency': 'FILEIO_MAX_CONCURRENCY',
+        'pool_size': 'FILEIO_HTTP_POOL_SIZE',
+        'max_retries': 'FILEIO_HTTP_MAX_RETRIES',
+        'thread_pool_size': 'FILEIO_THREAD_POOL_SIZE',
+    }
+
+    @classmethod
+    def from_env(cls):
+        env = os.environ
+        config = {}
+        for f in fields(cls):
+            val = env.get(cls._ENV_MAP[f.name])
+            if val is not None:
+                config[f.name] = cls._convert(f, val)
+        return cls(**config)
+
+    @staticmethod
+    def _convert(f, val):
+        try:
+            return f.type(val)
+        except (TypeError, ValueError):
+            raise ValueError(f'Invalid value for {f.name}: {val!r} is not a valid {f.type.__name__}') from None
+
+    def update_config(self, **config):
+        unknown = set(config).difference(self._ENV_MAP)
+        if unknown:
+            raise ValueError(f'Invalid settings {unknown}: {list(self._ENV_MAP.keys())}')
+        # Everything is converted before anything is set, so a bad value leaves the settings untouched
+        config = {f.name: self._convert(f, config[f.name]) for f in fields(self) if f.name in config}
+        for k, v in config.items():
+            setattr(self, k, v)
+
+    def dict(self):
+        return asdict(self)
+
+
+class LazySettings:
+    """
+    Proxy that only reads the environment into `FileIOSettings` on first attribute access
+    """
+    __slots__ = ('_settings',)
+
+    def __init__(self):
+        object.__setattr__(self, '_settings', None)
+
+    def _load(self):
+        if self._settings is None:
+            object.__setattr__(self, '_settings', FileIOSettings.from_env())
+        return self._settings
+
+    def __getattr__(self, name):
+        return getattr(self._settings or self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __repr__(self):
+        return repr(self._load())
+
+
+settings = LazySettings()
@@ -1,10 +1,53 @@
+import os
 import time
+import atexit
+import threading
 import multiprocessing as mp
+from concurrent import futures
 from tqdm.auto import tqdm
 
 from . import logger, _enable_pbar
 
-_cores = mp.cpu_count()
+_cores = os.cpu_count() or 1
+_executors = {}
+_executor_lock = threading.Lock()
+
+
+def get_executor(name='fileio', max_workers=None):
+    # One pool per name is kept alive so repeated batch calls don't rebuild threads.
+    # Asking for more workers installs a larger pool. The old one is never shut down here: callers still
+    # holding it keep submitting, and its idle threads exit once it is garbage collected.
+    # Callers bound their own parallelism (see `bounded_map`), so sharing a larger pool is safe.
+    max_workers = max_workers or _cores * 2
+    size, executor = _executors.get(name, (0, None))
+    if size < max_workers:
+        with _executor_lock:
+            size, executor = _executors.get(name, (0, None))
+            if size < max_workers:
+                executor = futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'fileio_{name}')
+                _executors[name] = (max_workers, executor)
+    return executor
+
+def bounded_map(executor, func, *iterables, limit=None):
+    """
+    Like `executor.map`, but with at most `limit` calls running at once. Returns the results in order
+    """
+    if not limit:
+        return list(executor.map(func, *iterables))
+    semaphore = threading.BoundedSemaphore(limit)
+    tasks = []
+    for args in zip(*iterables):
+        semaphore.acquire()
+        task = executor.submit(func, *args)
+        task.add_done_callback(lambda _: semaphore.release())
+        tasks.append(task)
+    return [task.result() for task in tasks]
+
+def _shutdown_executors():
+    for _, executor in _executors.values():
+        executor.shutdown(wait=False)
+
+atexit.register(_shutdown_executors)
 
 def create_multi_function(funct):
     return lambda x: funct(x)
@@ -1,16 +1,23 @@
 
 import os
 import sys
+import time
 import importlib
+import importlib.util
+import functools
 import threading
 import subprocess
-import pkg_resources
 import json
 from subprocess import check_output
 from abc import abstractmethod
 
 from . import logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 root = os.path.abspath(os.path.dirname(__file__))
 
 
@@ -47,12 +54,19 @@ def gsutil_exec(command, pbar = None, verbose = True):
                 sys.stdout.flush()
 
 def lazy_check(req):
+    # pkg_resources scans every installed distribution on import, so only pay for it when a check runs
+    import pkg_resources
     try:
         _ = pkg_resources.get_distribution(req)
         return True
     except pkg_resources.DistributionNotFound:
         return False
 
+@functools.lru_cache(maxsize=None)
+def module_avail(name):
+    # find_spec only searches the import path, unlike lazy_check which scans every installed distribution
+    return name in sys.modules or importlib.util.find_spec(name) is not None
+
 def lazy_install(req):
     _req = req.split('=')[0].replace('>','').replace('<','').strip()
     if lazy_check(_req):
@@ -109,44 +123,51 @@ auth_vars = {
     'adc': 'GOOGLE_APPLICATION_CREDENTIALS',
     'gproject': 'GOOGLE_CLOUD_PROJECT'
 }
-auth_file = os.path.join(root, 'utils/config.json')
+auth_file = os.path.join(root, 'config.json')
+auth_ttl = 5
+_auth_data = None
+_auth_expiry = 0.0
 
 class Auth(object):
+    # (config key, env var) for every value Auth exports
+    _env_exports = (
+        ('adc', auth_vars['adc']),
+        ('project', auth_vars['gproject']),
+    )
+
     def __init__(self, adc=None, project=None, overwrite=False):
         data = self.load()
-        if adc:
-            data['adc'] = adc
-            self.set_adc(adc)
-        elif data.get('adc', None) and not overwrite:
-            self.set_adc(data['adc'])
-        else:
-            adc_var = self.check(auth_vars['adc'])
-            if adc_var:
-                data['adc'] = adc_var
+        values = {'adc': adc, 'project': project}
+        env = {}
+        for key, env_var in self._env_exports:
+            if values[key]:
+                data[key] = values[key]
+                env[env_var] = values[key]
+            elif data.get(key, None) and not overwrite:
+                env[env_var] = data[key]
             else:
-                logger.info(f'ADC is not found or set')
-
-        if project:
-            data['project'] = project
-            self.set_gproject(project)
-        elif data.get('project', None) and not overwrite:
-            self.set_gproject(data['project'])
-        else:
-            gp_var = self.check(auth_vars['gproject'])
-            if gp_var:
-                data['project'] = gp_var
+                env_val = self.check(env_var)
+                if env_val:
+                    data[key] = env_val
+                elif key == 'adc':
+                    logger.info(f'ADC is not found or set')
+        if env:
+            self.export_env(env)
         self.save(data)
 
+    @classmethod
+    def export_env(cls, env):
+        for env_var, value in env.items():
+            logger.info(f'Setting {env_var} to {value}')
+        os.environ.update(env)
     
     @classmethod
     def set_adc(cls, adc):
-        logger.info(f'Setting ADC to {adc}')
-        os.environ[auth_vars['adc']] = adc
+        cls.export_env({auth_vars['adc']: adc})
     
     @classmethod
     def set_gproject(cls, project):
-        logger.info(f'Setting GCP PRoject to {project}')
-        os.environ[auth_vars['gproject']] = project
+        cls.export_env({auth_vars['gproject']: project})
     
     @classmethod
     def check(cls, name):
@@ -154,10 +175,27 @@ class Auth(object):
     
     @classmethod
     def load(cls):
-        if not os.path.exists(auth_file):
-            return {}
-        return json.load(open(auth_file, 'r'))
+        # Config is reused for auth_ttl seconds so repeated Auth() calls skip the disk,
+        # while a config written by another process is still picked up afterwards
+        global _auth_data, _auth_expiry
+        now = time.monotonic()
+        if _auth_data is None or now >= _auth_expiry:
+            try:
+                with open(auth_file, 'rb') as f:
+                    _auth_data = _json_loads(f.read())
+            except FileNotFoundError:
+                _auth_data = {}
+            _auth_expiry = now + auth_ttl
+        return dict(_auth_data)
 
     @classmethod
     def save(cls, data):
-        json.dump(open(auth_file, 'w'), indent=2)
+        # Only trust the cache for the skip while it is fresh, and refresh it with what was written
+        global _auth_data, _auth_expiry
+        now = time.monotonic()
+        if data == _auth_data and now < _auth_expiry:
+            return
+        with open(auth_file, 'w') as f:
+            json.dump(data, f, indent=2)
+        _auth_data = dict(data)
+        _auth_expiry = now + auth_ttl